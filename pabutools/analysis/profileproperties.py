@@ -176,7 +176,8 @@ def avg_total_score(instance: Instance, profile: AbstractCardinalProfile) -> Num
             The average score assigned to a project.
 
     """
-    return mean_generator(profile.total_score(project) for project in instance)
+    scores = profile.total_scores()
+    return mean_generator(scores.get(project, 0) for project in instance)
 
 
 def median_total_score(instance: Instance, profile: AbstractCardinalProfile) -> Numeric:
@@ -198,6 +199,5 @@ def median_total_score(instance: Instance, profile: AbstractCardinalProfile) ->
     """
     if len(instance) == 0:
         return 0
-    return float(
-        np.median([frac(profile.total_score(project)) for project in instance])
-    )
+    scores = profile.total_scores()
+    return float(np.median([frac(scores.get(project, 0)) for project in instance]))
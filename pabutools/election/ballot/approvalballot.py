@@ -63,9 +63,8 @@ class FrozenApprovalBallot(tuple[Project], FrozenBallot, AbstractApprovalBallot)
             if isinstance(init, AbstractBallot):
                 meta = init.meta
             else:
-                meta = dict
+                meta = dict()
         FrozenBallot.__init__(self, name, meta)
-        AbstractApprovalBallot.__init__(self)
 
     def __new__(
         cls,
@@ -126,7 +125,6 @@ class ApprovalBallot(set[Project], Ballot, AbstractApprovalBallot):
             else:
                 meta = dict()
         Ballot.__init__(self, name, meta)
-        AbstractApprovalBallot.__init__(self)
 
     def frozen(self) -> FrozenApprovalBallot:
         """
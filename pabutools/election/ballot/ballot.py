@@ -69,8 +69,6 @@ class FrozenBallot(AbstractBallot, ABC):
         if meta is None:
             meta = dict()
         AbstractBallot.__init__(self, name=name, meta=meta)
-        self.meta = meta
-        self.name = name
 
 
 class Ballot(AbstractBallot):
@@ -100,8 +98,6 @@ class Ballot(AbstractBallot):
         if meta is None:
             meta = dict()
         AbstractBallot.__init__(self, name=name, meta=meta)
-        self.meta = meta
-        self.name = name
 
     @abstractmethod
     def frozen(self) -> FrozenBallot:
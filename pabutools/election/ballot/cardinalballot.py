@@ -68,13 +68,12 @@ class FrozenCardinalBallot(
             else:
                 meta = dict()
         FrozenBallot.__init__(self, name=name, meta=meta)
-        AbstractCardinalBallot.__init__(self)
 
     def __setitem__(self, key, value):
         raise ValueError("You cannot set values of a FrozenCardinalBallot")
 
     def __hash__(self):
-        return tuple.__hash__(tuple(self.keys()))
+        return hash(frozenset(self))
 
 
 class CardinalBallot(dict[Project, Numeric], Ballot, AbstractCardinalBallot):
@@ -124,9 +123,8 @@ class CardinalBallot(dict[Project, Numeric], Ballot, AbstractCardinalBallot):
             if isinstance(init, AbstractBallot):
                 meta = init.meta
             else:
-                meta = dict
+                meta = dict()
         Ballot.__init__(self, name=name, meta=meta)
-        AbstractCardinalBallot.__init__(self)
 
     def complete(self, projects: Collection[Project], default_score: Numeric) -> None:
         """
@@ -153,14 +151,17 @@ class CardinalBallot(dict[Project, Numeric], Ballot, AbstractCardinalBallot):
             FrozenCardinalBallot
                 The frozen cardinal ballot.
         """
-        return FrozenCardinalBallot(self)
+        return FrozenCardinalBallot(self, name=self.name, meta=self.meta)
 
     # This allows dict method returning copies of a dict to work
     @classmethod
     def _wrap_methods(cls, names):
         def wrap_method_closure(name):
+            # The parent method is looked up once, not through super() at every call
+            parent_method = getattr(super(cls, cls), name)
+
             def inner(self, *args):
-                result = getattr(super(cls, self), name)(*args)
+                result = parent_method(self, *args)
                 if isinstance(result, dict) and not isinstance(result, cls):
                     result = cls(result, name=self.name, meta=self.meta)
                 return result
@@ -74,15 +74,14 @@ class FrozenCumulativeBallot(
             if isinstance(init, AbstractBallot):
                 meta = init.meta
             else:
-                meta = dict
+                meta = dict()
         FrozenBallot.__init__(self, name=name, meta=meta)
-        AbstractCumulativeBallot.__init__(self)
 
     def __setitem__(self, key, value):
         raise ValueError("You cannot set values of a FrozenCumulativeBallot")
 
     def __hash__(self):
-        return tuple.__hash__(tuple(self.keys()))
+        return hash(frozenset(self))
 
 
 class CumulativeBallot(CardinalBallot, AbstractCumulativeBallot):
@@ -133,9 +132,8 @@ class CumulativeBallot(CardinalBallot, AbstractCumulativeBallot):
             if isinstance(init, AbstractBallot):
                 meta = init.meta
             else:
-                meta = dict
+                meta = dict()
         CardinalBallot.__init__(self, init, name=name, meta=meta)
-        AbstractCumulativeBallot.__init__(self)
 
     def frozen(self) -> FrozenCumulativeBallot:
         """
@@ -146,13 +144,15 @@ class CumulativeBallot(CardinalBallot, AbstractCumulativeBallot):
             FrozenCumulativeBallot
                 The frozen cardinal ballot.
         """
-        return FrozenCumulativeBallot(self)
+        return FrozenCumulativeBallot(self, name=self.name, meta=self.meta)
 
     @classmethod
     def _wrap_methods(cls, names):
         def wrap_method_closure(name):
+            parent_method = getattr(super(cls, cls), name)
+
             def inner(self, *args):
-                result = getattr(super(cls, self), name)(*args)
+                result = parent_method(self, *args)
                 if isinstance(result, dict) and not isinstance(result, cls):
                     result = cls(result, name=self.name, meta=self.meta)
                 return result
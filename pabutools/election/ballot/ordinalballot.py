@@ -82,7 +82,6 @@ class FrozenOrdinalBallot(tuple[Project], FrozenBallot, AbstractOrdinalBallot):
             else:
                 meta = dict()
         FrozenBallot.__init__(self, name, meta)
-        AbstractOrdinalBallot.__init__(self)
 
     def __new__(
         cls,
@@ -153,7 +152,6 @@ class OrdinalBallot(dict, Ballot, AbstractOrdinalBallot):
                 meta = dict()
         dict.__init__(self, {e: None for e in init})
         Ballot.__init__(self, name=name, meta=meta)
-        AbstractOrdinalBallot.__init__(self)
 
     def append(self, project: Project) -> None:
         """
@@ -238,7 +236,7 @@ class OrdinalBallot(dict, Ballot, AbstractOrdinalBallot):
             FrozenOrdinalBallot
                 The frozen ordinal ballot.
         """
-        return FrozenOrdinalBallot(self)
+        return FrozenOrdinalBallot(self, name=self.name, meta=self.meta)
 
     def __eq__(self, other) -> bool:
         if not isinstance(other, OrdinalBallot):
@@ -433,8 +433,10 @@ class Instance(set[Project]):
         if available_projects is None:
             available_projects = self
         cost = total_cost(projects)
+        # Membership is tested for every available project, projects is often a list
+        selected = set(projects)
         for p in available_projects:
-            if p not in projects and (p.cost + cost <= self.budget_limit):
+            if p.cost + cost <= self.budget_limit and p not in selected:
                 return False
         return True
 
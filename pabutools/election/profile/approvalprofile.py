@@ -126,7 +126,11 @@ class AbstractApprovalProfile(AbstractProfile, ABC, Iterable[AbstractApprovalBal
             bool
                 `True` if the profile is party-list and `False` otherwise.
         """
-        return all(len(b1 & b2) in (0, len(b1)) for b1 in self for b2 in self)
+        # Frozen approval ballots are tuples, they are turned into sets once here
+        ballots = [frozenset(b) for b in self]
+        return all(
+            b1.isdisjoint(b2) or b1 <= b2 for b1 in ballots for b2 in ballots
+        )
 
 
 class ApprovalProfile(Profile, AbstractApprovalProfile):
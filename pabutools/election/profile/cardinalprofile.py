@@ -77,10 +77,29 @@ class AbstractCardinalProfile(AbstractProfile, ABC, Iterable[AbstractCardinalBal
         """
         score = 0
         for ballot in self:
-            if project in ballot:
-                score += ballot[project] * self.multiplicity(ballot)
+            ballot_score = ballot.get(project)
+            if ballot_score is not None:
+                score += ballot_score * self.multiplicity(ballot)
         return score
 
+    def total_scores(self) -> dict[Project, Numeric]:
+        """
+        Returns the total score of all the projects that have been assigned a score by at least one voter. The profile
+        is only traversed once, which is faster than calling
+        :py:meth:`~pabutools.election.profile.cardinalprofile.AbstractCardinalProfile.total_score` for each project.
+
+        Returns
+        -------
+            dict[:py:class:`~pabutools.election.instance.Project`, Numeric]
+                A dictionary mapping every project appearing in a ballot to its total score.
+        """
+        scores = dict()
+        for ballot in self:
+            multiplicity = self.multiplicity(ballot)
+            for project, ballot_score in ballot.items():
+                scores[project] = scores.get(project, 0) + ballot_score * multiplicity
+        return scores
+
 
 class CardinalProfile(Profile, AbstractCardinalProfile):
     """
@@ -148,14 +167,15 @@ class CardinalProfile(Profile, AbstractCardinalProfile):
         legal_min_score: Numeric | None = None,
         legal_max_score: Numeric | None = None,
     ) -> None:
-        if legal_min_length is None and isinstance(init, AbstractCardinalProfile):
-            legal_min_length = init.legal_min_length
-        if legal_max_length is None and isinstance(init, AbstractCardinalProfile):
-            legal_max_length = init.legal_max_length
-        if legal_min_score is None and isinstance(init, AbstractCardinalProfile):
-            legal_min_score = init.legal_min_score
-        if legal_max_score is None and isinstance(init, AbstractCardinalProfile):
-            legal_max_score = init.legal_max_score
+        if isinstance(init, AbstractCardinalProfile):
+            if legal_min_length is None:
+                legal_min_length = init.legal_min_length
+            if legal_max_length is None:
+                legal_max_length = init.legal_max_length
+            if legal_min_score is None:
+                legal_min_score = init.legal_min_score
+            if legal_max_score is None:
+                legal_max_score = init.legal_max_score
         AbstractCardinalProfile.__init__(
             self,
             legal_min_length=legal_min_length,
@@ -218,27 +238,41 @@ class CardinalProfile(Profile, AbstractCardinalProfile):
         for ballot in self:
             ballot.complete(projects, default_score)
 
+    def _rebuild(self, ballots, revalidate=True):
+        # Builds a profile of the same class and with the same attributes as self
+        result = type(self)(
+            ballots,
+            instance=self.instance,
+            ballot_validation=self.ballot_validation and revalidate,
+            ballot_type=self.ballot_type,
+            legal_min_length=self.legal_min_length,
+            legal_max_length=self.legal_max_length,
+            legal_min_score=self.legal_min_score,
+            legal_max_score=self.legal_max_score,
+        )
+        result.ballot_validation = self.ballot_validation
+        return result
+
+    def __getitem__(self, index):
+        # Indexing is used when iterating over voters, only slices need to be wrapped
+        if isinstance(index, slice):
+            return self._rebuild(list.__getitem__(self, index), revalidate=False)
+        return list.__getitem__(self, index)
+
     def sort(self, *, key=None, reverse=None):
         raise NotImplementedError(
             "Cardinal profiles cannot be sorted as cardinal ballots do not support '<'"
         )
 
     @classmethod
-    def _wrap_methods(cls, names):
+    def _wrap_methods(cls, names, revalidate=True):
         def wrap_method_closure(name):
+            parent_method = getattr(super(cls, cls), name)
+
             def inner(self, *args):
-                result = getattr(super(cls, self), name)(*args)
+                result = parent_method(self, *args)
                 if isinstance(result, list) and not isinstance(result, cls):
-                    result = cls(
-                        result,
-                        instance=self.instance,
-                        ballot_validation=self.ballot_validation,
-                        ballot_type=self.ballot_type,
-                        legal_min_length=self.legal_min_length,
-                        legal_max_length=self.legal_max_length,
-                        legal_min_score=self.legal_min_score,
-                        legal_max_score=self.legal_max_score,
-                    )
+                    result = self._rebuild(result, revalidate=revalidate)
                 return result
 
             inner.fn_name = name
@@ -252,15 +286,14 @@ CardinalProfile._wrap_methods(
     [
         "__add__",
         "__iadd__",
-        "__imul__",
-        "__mul__",
         "__reversed__",
-        "__rmul__",
-        "copy",
         "reverse",
-        "__getitem__",
     ]
 )
+# The ballots of the results of these methods all come from an already validated profile
+CardinalProfile._wrap_methods(
+    ["__imul__", "__mul__", "__rmul__", "copy"], revalidate=False
+)
 
 
 class CardinalMultiProfile(MultiProfile, AbstractCardinalProfile):
@@ -334,26 +367,21 @@ class CardinalMultiProfile(MultiProfile, AbstractCardinalProfile):
         legal_min_score: Numeric | None = None,
         legal_max_score: Numeric | None = None,
     ) -> None:
-        if legal_min_length is None:
-            if isinstance(init, AbstractCardinalProfile):
-                legal_min_length = init.legal_min_length
-            elif profile:
-                legal_min_length = profile.legal_min_length
-        if legal_max_length is None:
-            if isinstance(init, AbstractCardinalProfile):
-                legal_max_length = init.legal_max_length
-            elif profile:
-                legal_max_length = profile.legal_max_length
-        if legal_min_score is None:
-            if isinstance(init, AbstractCardinalProfile):
-                legal_min_score = init.legal_min_score
-            elif profile:
-                legal_min_score = profile.legal_min_score
-        if legal_max_score is None:
-            if isinstance(init, AbstractCardinalProfile):
-                legal_max_score = init.legal_max_score
-            elif profile:
-                legal_max_score = profile.legal_max_score
+        if isinstance(init, AbstractCardinalProfile):
+            legal_source = init
+        elif profile:
+            legal_source = profile
+        else:
+            legal_source = None
+        if legal_source is not None:
+            if legal_min_length is None:
+                legal_min_length = legal_source.legal_min_length
+            if legal_max_length is None:
+                legal_max_length = legal_source.legal_max_length
+            if legal_min_score is None:
+                legal_min_score = legal_source.legal_min_score
+            if legal_max_score is None:
+                legal_max_score = legal_source.legal_max_score
         AbstractCardinalProfile.__init__(
             self,
             legal_min_length=legal_min_length,
@@ -386,6 +414,46 @@ class CardinalMultiProfile(MultiProfile, AbstractCardinalProfile):
         if profile is not None:
             self.extend(profile)
 
+    def total_score(self, project: Project) -> Numeric:
+        """
+        Returns the total score of a project, that is, the sum of scores received from all voters. The ballots and
+        their multiplicities are read in a single pass over the multiprofile, so that the (frozen) ballots do not need
+        to be hashed again to retrieve their multiplicity.
+
+        Parameters
+        ----------
+            project : :py:class:`~pabutools.election.instance.Project`
+                The project.
+
+        Returns
+        -------
+            Numeric
+                The total score assigned to the project.
+        """
+        score = 0
+        for ballot, multiplicity in self.items():
+            ballot_score = ballot.get(project)
+            if ballot_score is not None:
+                score += ballot_score * multiplicity
+        return score
+
+    def total_scores(self) -> dict[Project, Numeric]:
+        """
+        Returns the total score of all the projects that have been assigned a score by at least one voter. The
+        multiprofile is only traversed once, which is faster than calling
+        :py:meth:`~pabutools.election.profile.cardinalprofile.CardinalMultiProfile.total_score` for each project.
+
+        Returns
+        -------
+            dict[:py:class:`~pabutools.election.instance.Project`, Numeric]
+                A dictionary mapping every project appearing in a ballot to its total score.
+        """
+        scores = dict()
+        for ballot, multiplicity in self.items():
+            for project, ballot_score in ballot.items():
+                scores[project] = scores.get(project, 0) + ballot_score * multiplicity
+        return scores
+
     def score(self, project: Project) -> Numeric:
         """
         Returns the score of a project, that is, the sum of scores received from all voters.
@@ -397,17 +465,15 @@ class CardinalMultiProfile(MultiProfile, AbstractCardinalProfile):
         -------
             Fraction
         """
-        score = 0
-        for ballot, multiplicity in self.items():
-            if project in ballot:
-                score += ballot[project] * multiplicity
-        return score
+        return self.total_score(project)
 
     @classmethod
     def _wrap_methods(cls, names):
         def wrap_method_closure(name):
+            parent_method = getattr(super(cls, cls), name)
+
             def inner(self, *args):
-                result = getattr(super(cls, self), name)(*args)
+                result = parent_method(self, *args)
                 if isinstance(result, dict) and not isinstance(result, cls):
                     result = cls(
                         result,
@@ -449,8 +515,6 @@ CardinalMultiProfile._wrap_methods(
         "__iand__",
         "__ior__",
         "__isub__",
-        "__imul__",
-        "__mul__",
         "__or__",
         "__ror__",
         "__sub__",
@@ -161,22 +161,20 @@ class CumulativeProfile(CardinalProfile, AbstractCumulativeProfile):
         legal_min_total_score: Numeric | None = None,
         legal_max_total_score: Numeric | None = None,
     ) -> None:
-        if legal_min_length is None and isinstance(init, AbstractCardinalProfile):
-            legal_min_length = init.legal_min_length
-        if legal_max_length is None and isinstance(init, AbstractCardinalProfile):
-            legal_max_length = init.legal_max_length
-        if legal_min_score is None and isinstance(init, AbstractCardinalProfile):
-            legal_min_score = init.legal_min_score
-        if legal_max_score is None and isinstance(init, AbstractCardinalProfile):
-            legal_max_score = init.legal_max_score
-        if legal_min_total_score is None and isinstance(
-            init, AbstractCumulativeProfile
-        ):
-            legal_min_total_score = init.legal_min_total_score
-        if legal_max_total_score is None and isinstance(
-            init, AbstractCumulativeProfile
-        ):
-            legal_max_total_score = init.legal_max_total_score
+        if isinstance(init, AbstractCardinalProfile):
+            if legal_min_length is None:
+                legal_min_length = init.legal_min_length
+            if legal_max_length is None:
+                legal_max_length = init.legal_max_length
+            if legal_min_score is None:
+                legal_min_score = init.legal_min_score
+            if legal_max_score is None:
+                legal_max_score = init.legal_max_score
+        if isinstance(init, AbstractCumulativeProfile):
+            if legal_min_total_score is None:
+                legal_min_total_score = init.legal_min_total_score
+            if legal_max_total_score is None:
+                legal_max_total_score = init.legal_max_total_score
         AbstractCumulativeProfile.__init__(
             self,
             legal_min_length=legal_min_length,
@@ -226,52 +224,17 @@ class CumulativeProfile(CardinalProfile, AbstractCumulativeProfile):
             legal_max_score=self.legal_max_score,
         )
 
+    def _rebuild(self, ballots, revalidate=True):
+        result = CardinalProfile._rebuild(self, ballots, revalidate=revalidate)
+        result.legal_min_total_score = self.legal_min_total_score
+        result.legal_max_total_score = self.legal_max_total_score
+        return result
+
     def sort(self, *, key=None, reverse=None):
         raise NotImplementedError(
             "Cumulative profiles cannot be sorted as cumulative ballots do not support '<'"
         )
 
-    @classmethod
-    def _wrap_methods(cls, names):
-        def wrap_method_closure(name):
-            def inner(self, *args):
-                result = getattr(super(cls, self), name)(*args)
-                if isinstance(result, list) and not isinstance(result, cls):
-                    result = cls(
-                        result,
-                        instance=self.instance,
-                        ballot_validation=self.ballot_validation,
-                        ballot_type=self.ballot_type,
-                        legal_min_length=self.legal_min_length,
-                        legal_max_length=self.legal_max_length,
-                        legal_min_score=self.legal_min_score,
-                        legal_max_score=self.legal_max_score,
-                        legal_min_total_score=self.legal_min_total_score,
-                        legal_max_total_score=self.legal_max_total_score,
-                    )
-                return result
-
-            inner.fn_name = name
-            setattr(cls, name, inner)
-
-        for n in names:
-            wrap_method_closure(n)
-
-
-CumulativeProfile._wrap_methods(
-    [
-        "__add__",
-        "__iadd__",
-        "__imul__",
-        "__mul__",
-        "__reversed__",
-        "__rmul__",
-        "copy",
-        "reverse",
-        "__getitem__",
-    ]
-)
-
 
 class CumulativeMultiProfile(CardinalMultiProfile, AbstractCumulativeProfile):
     """
@@ -356,36 +319,32 @@ class CumulativeMultiProfile(CardinalMultiProfile, AbstractCumulativeProfile):
         legal_min_total_score: Numeric | None = None,
         legal_max_total_score: Numeric | None = None,
     ) -> None:
-        if legal_min_length is None:
-            if isinstance(init, AbstractCardinalProfile):
-                legal_min_length = init.legal_min_length
-            elif profile:
-                legal_min_length = profile.legal_min_length
-        if legal_max_length is None:
-            if isinstance(init, AbstractCardinalProfile):
-                legal_max_length = init.legal_max_length
-            elif profile:
-                legal_max_length = profile.legal_max_length
-        if legal_min_score is None:
-            if isinstance(init, AbstractCardinalProfile):
-                legal_min_score = init.legal_min_score
-            elif profile:
-                legal_min_score = profile.legal_min_score
-        if legal_max_score is None:
-            if isinstance(init, AbstractCardinalProfile):
-                legal_max_score = init.legal_max_score
-            elif profile:
-                legal_max_score = profile.legal_max_score
-        if legal_min_total_score is None:
-            if isinstance(init, AbstractCumulativeProfile):
-                legal_min_total_score = init.legal_min_total_score
-            elif profile:
-                legal_min_total_score = profile.legal_min_total_score
-        if legal_max_total_score is None:
-            if isinstance(init, AbstractCumulativeProfile):
-                legal_max_total_score = init.legal_max_total_score
-            elif profile:
-                legal_max_total_score = profile.legal_max_total_score
+        if isinstance(init, AbstractCardinalProfile):
+            legal_source = init
+        elif profile:
+            legal_source = profile
+        else:
+            legal_source = None
+        if legal_source is not None:
+            if legal_min_length is None:
+                legal_min_length = legal_source.legal_min_length
+            if legal_max_length is None:
+                legal_max_length = legal_source.legal_max_length
+            if legal_min_score is None:
+                legal_min_score = legal_source.legal_min_score
+            if legal_max_score is None:
+                legal_max_score = legal_source.legal_max_score
+        if isinstance(init, AbstractCumulativeProfile):
+            total_score_source = init
+        elif profile:
+            total_score_source = profile
+        else:
+            total_score_source = None
+        if total_score_source is not None:
+            if legal_min_total_score is None:
+                legal_min_total_score = total_score_source.legal_min_total_score
+            if legal_max_total_score is None:
+                legal_max_total_score = total_score_source.legal_max_total_score
         AbstractCumulativeProfile.__init__(
             self,
             legal_min_length=legal_min_length,
@@ -429,8 +388,10 @@ class CumulativeMultiProfile(CardinalMultiProfile, AbstractCumulativeProfile):
     @classmethod
     def _wrap_methods(cls, names):
         def wrap_method_closure(name):
+            parent_method = getattr(super(cls, cls), name)
+
             def inner(self, *args):
-                result = getattr(super(cls, self), name)(*args)
+                result = parent_method(self, *args)
                 if isinstance(result, dict) and not isinstance(result, cls):
                     result = cls(
                         result,
@@ -476,8 +437,6 @@ CumulativeMultiProfile._wrap_methods(
         "__iand__",
         "__ior__",
         "__isub__",
-        "__imul__",
-        "__mul__",
         "__or__",
         "__ror__",
         "__sub__",
@@ -130,7 +130,15 @@ class AdditiveSatisfaction(SatisfactionMeasure):
         return score
 
     def sat(self, proj: Collection[Project]) -> Numeric:
-        return sum(self.get_project_sat(p) for p in proj)
+        # The cached scores are read directly, get_project_sat is only called on a cache miss
+        scores = self.scores
+        res = 0
+        for p in proj:
+            score = scores.get(p)
+            if score is None:
+                score = self.get_project_sat(p)
+            res += score
+        return res
 
     def sat_project(self, project: Project) -> Numeric:
         return self.get_project_sat(project)
@@ -609,9 +617,12 @@ def effort_sat_func(
         Numeric
             The effort satisfaction.
     """
+    # The denominator goes through the whole profile, no need to compute it if the project is not in the ballot
+    if project not in ballot:
+        return 0
     denominator = sum(1 for b in profile if project in b)
     if denominator:
-        return int(project in ballot) * frac(project.cost, denominator)
+        return frac(project.cost, denominator)
     return 0
 
 
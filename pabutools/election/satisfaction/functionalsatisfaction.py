@@ -55,6 +55,8 @@ class FunctionalSatisfaction(SatisfactionMeasure):
         func : Callable[[:py:class:`~pabutools.election.instance.Instance`, :py:class:`~pabutools.election.profile.profile.AbstractProfile`, :py:class:`~pabutools.election.ballot.ballot.AbstractBallot`, Iterable[:py:class:`~pabutools.election.instance.Project`], Numeric]
             The actual satisfaction function, i.e., a function returning the satisfaction for a given collection of
             projects, given the instance, the profile and the ballot under consideration.
+        project_sats : dict[:py:class:`~pabutools.election.instance.Project`, Numeric]
+            The satisfaction of the individual projects, stored after computation to avoid re-computing them.
     """
 
     def __init__(
@@ -68,12 +70,17 @@ class FunctionalSatisfaction(SatisfactionMeasure):
     ):
         SatisfactionMeasure.__init__(self, instance, profile, ballot)
         self.func = func
+        self.project_sats = dict()
 
     def sat(self, projects: Collection[Project]) -> Numeric:
         return self.func(self.instance, self.profile, self.ballot, projects)
 
     def sat_project(self, project: Project) -> Numeric:
-        return self.sat([project])
+        sat = self.project_sats.get(project, None)
+        if sat is None:
+            sat = self.sat([project])
+            self.project_sats[project] = sat
+        return sat
 
 
 def cc_sat_func_app(
@@ -135,8 +142,9 @@ def cc_sat_func_card(
     """
     res = 0
     for p in projects:
-        if p in ballot and ballot[p] > res:
-            res = ballot[p]
+        score = ballot.get(p)
+        if score is not None and score > res:
+            res = score
     return res
 
 
@@ -70,13 +70,14 @@ def greedy_utilitarian_scheme(
         else:
             best_marginal_score = None
             argmax_marginal_score = []
+            # The satisfaction of the current allocation is the same for all the projects
+            current_satisfaction = sats.total_satisfaction(alloc)
             for project in feasible:
                 new_alloc = copy(alloc)
                 new_alloc.append(project)
                 if project.cost > 0:
                     total_marginal_score = frac(
-                        sats.total_satisfaction(new_alloc)
-                        - sats.total_satisfaction(alloc),
+                        sats.total_satisfaction(new_alloc) - current_satisfaction,
                         project.cost,
                     )
                 else:
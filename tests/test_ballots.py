@@ -95,8 +95,13 @@ class TestBallot(TestCase):
             == set(frozen_ballot2)
             == set(frozen_ballot3)
         )
-        assert ballot.name == frozen_ballot2.name == frozen_ballot3.name
-        assert ballot.meta == frozen_ballot2.meta == frozen_ballot3.meta
+        assert ballot.name == frozen_ballot2.name == frozen_ballot3.name == "AppBallot"
+        assert (
+            ballot.meta
+            == frozen_ballot2.meta
+            == frozen_ballot3.meta
+            == {"metakey": "value"}
+        )
 
         # Test the random generation of approval ballots
         get_random_approval_ballot([p1, p2, p3, p4, p5, p6])
@@ -143,8 +148,13 @@ class TestBallot(TestCase):
             assert (
                 ballot[p] == frozen_ballot1[p] == frozen_ballot2[p] == frozen_ballot3[p]
             )
-        assert ballot.name == frozen_ballot2.name == frozen_ballot3.name
-        assert ballot.meta == frozen_ballot2.meta == frozen_ballot3.meta
+        assert ballot.name == frozen_ballot2.name == frozen_ballot3.name == "CardBallot"
+        assert (
+            ballot.meta
+            == frozen_ballot2.meta
+            == frozen_ballot3.meta
+            == {"MetaKey": "Value"}
+        )
 
         # Test that frozen ballots are indeed frozen
         with self.assertRaises(ValueError):
@@ -158,6 +168,10 @@ class TestBallot(TestCase):
 
         # Test frozen ballots methods
         hash(frozen_ballot1)
+        assert hash(frozen_ballot1) == hash(
+            FrozenCardinalBallot(dict(reversed(frozen_ballot1.items())))
+        )
+        assert len({frozen_ballot1, frozen_ballot2}) == 1
 
     def test_cumulative_ballot(self):
         """
@@ -198,8 +212,13 @@ class TestBallot(TestCase):
             assert (
                 ballot[p] == frozen_ballot1[p] == frozen_ballot2[p] == frozen_ballot3[p]
             )
-        assert ballot.name == frozen_ballot2.name == frozen_ballot3.name
-        assert ballot.meta == frozen_ballot2.meta == frozen_ballot3.meta
+        assert ballot.name == frozen_ballot2.name == frozen_ballot3.name == "CumBallot"
+        assert (
+            ballot.meta
+            == frozen_ballot2.meta
+            == frozen_ballot3.meta
+            == {"MetaKey": "Value"}
+        )
 
         # Test that frozen ballots are indeed frozen
         with self.assertRaises(ValueError):
@@ -208,6 +227,9 @@ class TestBallot(TestCase):
         # Test frozen ballots methods
         FrozenCumulativeBallot()
         hash(frozen_ballot1)
+        assert hash(frozen_ballot1) == hash(
+            FrozenCumulativeBallot(dict(reversed(frozen_ballot1.items())))
+        )
 
     def test_ordinal_ballot(self):
         """
@@ -299,8 +321,13 @@ class TestBallot(TestCase):
             == list(frozen_ballot2)
             == list(frozen_ballot3)
         )
-        assert ballot.name == frozen_ballot2.name == frozen_ballot3.name
-        assert ballot.meta == frozen_ballot2.meta == frozen_ballot3.meta
+        assert ballot.name == frozen_ballot2.name == frozen_ballot3.name == "OrdBallot"
+        assert (
+            ballot.meta
+            == frozen_ballot2.meta
+            == frozen_ballot3.meta
+            == {"metakey": "value"}
+        )
 
         # Test that we fail if projects are repeated
         with self.assertRaises(ValueError):
@@ -178,6 +178,10 @@ class TestProfile(TestCase):
         assert len(multiprofile2) == 2
         assert multiprofile2.total() == 14
 
+        # Test party list check
+        assert multiprofile.is_party_list() is False
+        assert ApprovalMultiProfile((b1, b1)).is_party_list() is True
+
         # Test constructor from multiprofile
         m = ApprovalMultiProfile(multiprofile)
         check_members_equality(multiprofile, m)
@@ -245,6 +249,13 @@ class TestProfile(TestCase):
         profile2 = CardinalProfile(profile)
         check_members_equality(profile, profile2)
 
+        # Test copies and slices keep the attributes of the profile
+        check_members_equality(profile, profile.copy())
+        check_members_equality(profile, profile[:1])
+        assert profile[:1] == [b1]
+        check_members_equality(profile, profile * 2)
+        assert len(profile * 2) == 4
+
         # Test ballot validation
         app_ballot = ApprovalBallot([projects[1], projects[2]])
         with self.assertRaises(TypeError):
@@ -295,6 +306,14 @@ class TestProfile(TestCase):
         assert len(multiprofile2) == 2
         assert multiprofile2.total() == 14
 
+        # Test the total score
+        for project in projects:
+            assert multiprofile2.total_score(project) == profile.total_score(project)
+        assert multiprofile2.total_score(projects[5]) == 80
+        assert multiprofile2.total_scores() == {projects[2]: 20, projects[5]: 80}
+        assert profile.total_scores() == multiprofile2.total_scores()
+        assert multiprofile.score(projects[1]) == 8 * 2 + 1 + 4
+
         # Test constructor from multiprofile
         m = CardinalMultiProfile(multiprofile)
         check_members_equality(multiprofile, m)
@@ -362,6 +381,11 @@ class TestProfile(TestCase):
         profile2 = CumulativeProfile(profile)
         check_members_equality(profile, profile2)
 
+        # Test slices keep the attributes of the profile
+        assert isinstance(profile[1:], CumulativeProfile)
+        check_members_equality(profile, profile[1:])
+        assert profile[1:] == [b2, b3]
+
         # Test ballot validation
         app_ballot = ApprovalBallot([projects[0], projects[2]])
         with self.assertRaises(TypeError):
@@ -1,3 +1,5 @@
+from functools import lru_cache
+from itertools import product
 from unittest import TestCase
 
 from pabutools.fractions import frac
@@ -27,6 +29,12 @@ from pabutools.rules.maxwelfare import max_additive_utilitarian_welfare
 from pabutools.rules.mes import method_of_equal_shares
 
 
+# Projects are never modified by the tests, the same (name, cost) pair can be shared
+@lru_cache(maxsize=None)
+def get_project(name, cost):
+    return Project(name, cost)
+
+
 def mes_iterated(
     instance,
     profile,
@@ -82,19 +90,89 @@ class DummyElection:
         self.irr_results_non_sat = dict()
         for rule in ALL_NON_SAT_RULES:
             self.irr_results_non_sat[rule] = None
+        self._multiprofile = None
+        self._sat_profiles = dict()
+        self._sat_profiles_from_orig = dict()
+        self._sorted_irr_results_sat = dict()
+
+    def get_multiprofile(self):
+        if self._multiprofile is None:
+            self._multiprofile = self.profile.as_multiprofile()
+        return self._multiprofile
+
+    def get_sat_profile(self, sat_class, multiprofile=False):
+        key = (multiprofile, sat_class)
+        if key not in self._sat_profiles:
+            if multiprofile:
+                profile = self.get_multiprofile()
+            else:
+                profile = self.profile
+            self._sat_profiles[key] = profile.as_sat_profile(sat_class)
+        return self._sat_profiles[key]
+
+    def get_sorted_irr_results_sat(self, rule, sat_class):
+        # The expected outcomes as a sorted list of sorted tuples, and as a set of the
+        # same tuples for membership tests
+        key = (rule, sat_class)
+        if key not in self._sorted_irr_results_sat:
+            sorted_results = sorted(
+                tuple(sorted(x)) for x in self.irr_results_sat[rule][sat_class]
+            )
+            self._sorted_irr_results_sat[key] = (
+                sorted_results,
+                frozenset(sorted_results),
+            )
+        return self._sorted_irr_results_sat[key]
+
+    def get_sat_profile_from_orig(self, sat_class):
+        if sat_class not in self._sat_profiles_from_orig:
+            self._sat_profiles_from_orig[sat_class] = SatisfactionProfile(
+                profile=self.profile, sat_class=sat_class
+            )
+        return self._sat_profiles_from_orig[sat_class]
+
+
+# Running example from Lackner & Skowron 2023, shared by several tests
+@lru_cache(maxsize=1)
+def lackner_skowron_example():
+    p = [
+        get_project("a", 1),
+        get_project("b", 1),
+        get_project("c", 1),
+        get_project("d", 1),
+        get_project("e", 1),
+        get_project("f", 1),
+        get_project("g", 1),
+    ]
+    inst = Instance(p, budget_limit=4)
+    prof = ApprovalProfile(
+        [ApprovalBallot({p[0], p[1]})] * 3
+        + [ApprovalBallot({p[0], p[2]})] * 3
+        + [ApprovalBallot({p[0], p[3]})] * 2
+        + [
+            ApprovalBallot({p[1], p[2], p[5]}),
+            ApprovalBallot({p[4]}),
+            ApprovalBallot({p[5]}),
+            ApprovalBallot({p[6]}),
+        ],
+        instance=inst,
+    )
+    return p, inst, prof
 
 
 def dummy_elections():
     res = []
 
     # Approval example 1
-    p = [Project("p0", 1), Project("p1", 3), Project("p2", 2), Project("p3", 1)]
+    p = [
+        get_project("p0", 1),
+        get_project("p1", 3),
+        get_project("p2", 2),
+        get_project("p3", 1),
+    ]
     inst = Instance(p, budget_limit=3)
     prof = ApprovalProfile(
-        [
-            ApprovalBallot((p[0], p[1], p[2], p[3])),
-            ApprovalBallot((p[0], p[1], p[2], p[3])),
-        ],
+        [ApprovalBallot((p[0], p[1], p[2], p[3]))] * 2,
         instance=inst,
     )
     test_election = DummyElection("AppEx_1", p, inst, prof)
@@ -113,15 +191,17 @@ def dummy_elections():
     res.append(test_election)
 
     # Approval example 2
-    p = [Project("p0", 1), Project("p1", 0.9), Project("p2", 2), Project("p3", 1.09)]
+    p = [
+        get_project("p0", 1),
+        get_project("p1", 0.9),
+        get_project("p2", 2),
+        get_project("p3", 1.09),
+    ]
     inst = Instance(p, budget_limit=4)
     prof = ApprovalProfile(
-        [
-            ApprovalBallot({p[0]}),
-            ApprovalBallot({p[1], p[2], p[3]}),
-            ApprovalBallot({p[1], p[2], p[3]}),
-            ApprovalBallot({p[2]}),
-        ],
+        [ApprovalBallot({p[0]})]
+        + [ApprovalBallot({p[1], p[2], p[3]})] * 2
+        + [ApprovalBallot({p[2]})],
         instance=inst,
     )
     test_election = DummyElection("AppEx_2", p, inst, prof)
@@ -139,21 +219,18 @@ def dummy_elections():
 
     # Approval example 3 - With app score 0
     p = [
-        Project("p0", 1),
-        Project("p1", 0.9),
-        Project("p2", 2),
-        Project("p3", 1.09),
-        Project("p4", 1.09),
-        Project("p5", 1.09),
+        get_project("p0", 1),
+        get_project("p1", 0.9),
+        get_project("p2", 2),
+        get_project("p3", 1.09),
+        get_project("p4", 1.09),
+        get_project("p5", 1.09),
     ]
     inst = Instance(p, budget_limit=4)
     prof = ApprovalProfile(
-        [
-            ApprovalBallot({p[0]}),
-            ApprovalBallot({p[1], p[2], p[3]}),
-            ApprovalBallot({p[1], p[2], p[3]}),
-            ApprovalBallot({p[2]}),
-        ],
+        [ApprovalBallot({p[0]})]
+        + [ApprovalBallot({p[1], p[2], p[3]})] * 2
+        + [ApprovalBallot({p[2]})],
         instance=inst,
     )
     test_election = DummyElection("AppEx_3", p, inst, prof)
@@ -168,9 +245,9 @@ def dummy_elections():
 
     # Approval example 4 - With project with cost 0
     p = [
-        Project("p0", 0),
-        Project("p1", 1),
-        Project("p2", 2),
+        get_project("p0", 0),
+        get_project("p1", 1),
+        get_project("p2", 2),
     ]
     inst = Instance(p, budget_limit=2)
     prof = ApprovalProfile(
@@ -205,21 +282,25 @@ def dummy_elections():
     res.append(test_election)
 
     # Empty profile
-    p = [Project("p0", 1), Project("p1", 3), Project("p2", 2), Project("p3", 1)]
+    p = [
+        get_project("p0", 1),
+        get_project("p1", 3),
+        get_project("p2", 2),
+        get_project("p3", 1),
+    ]
     inst = Instance(p, budget_limit=3)
     prof = ApprovalProfile([ApprovalBallot()], instance=inst)
     test_election = DummyElection("EmptyProfile", p, inst, prof)
+    all_allocs = [sorted(list(b)) for b in inst.budget_allocations()]
+    sorted_allocs = sorted(all_allocs)
+    sorted_exhaustive_allocs = sorted(b for b in all_allocs if inst.is_exhaustive(b))
     for sat_class in ALL_SAT:
         test_election.irr_results_sat[max_additive_utilitarian_welfare][
             sat_class
-        ] = sorted([sorted(list(b)) for b in inst.budget_allocations()])
-        test_election.irr_results_sat[greedy_utilitarian_welfare][sat_class] = sorted(
-            [
-                sorted(list(b))
-                for b in inst.budget_allocations()
-                if inst.is_exhaustive(b)
-            ]
-        )
+        ] = sorted_allocs
+        test_election.irr_results_sat[greedy_utilitarian_welfare][
+            sat_class
+        ] = sorted_exhaustive_allocs
         test_election.irr_results_sat[method_of_equal_shares][sat_class] = [[]]
         test_election.irr_results_sat[mes_iterated][sat_class] = [[]]
     test_election.irr_results_non_sat[sequential_phragmen] = [
@@ -231,22 +312,28 @@ def dummy_elections():
     res.append(test_election)
 
     # Empty profile with initial alloc
-    p = [Project("p0", 1), Project("p1", 3), Project("p2", 2), Project("p3", 1)]
+    p = [
+        get_project("p0", 1),
+        get_project("p1", 3),
+        get_project("p2", 2),
+        get_project("p3", 1),
+    ]
     inst = Instance(p, budget_limit=3)
     prof = ApprovalProfile([ApprovalBallot()], instance=inst)
     initial_alloc = p[:1]
     test_election = DummyElection("EmptyProfile_Initial", p, inst, prof, initial_alloc)
+    allocs_with_p0 = [sorted(list(b)) for b in inst.budget_allocations() if p[0] in b]
+    sorted_allocs = sorted(allocs_with_p0)
+    sorted_exhaustive_allocs = sorted(
+        b for b in allocs_with_p0 if inst.is_exhaustive(b)
+    )
     for sat_class in ALL_SAT:
         test_election.irr_results_sat[max_additive_utilitarian_welfare][
             sat_class
-        ] = sorted([sorted(list(b)) for b in inst.budget_allocations() if p[0] in b])
-        test_election.irr_results_sat[greedy_utilitarian_welfare][sat_class] = sorted(
-            [
-                sorted(list(b))
-                for b in inst.budget_allocations()
-                if p[0] in b and inst.is_exhaustive(b)
-            ]
-        )
+        ] = sorted_allocs
+        test_election.irr_results_sat[greedy_utilitarian_welfare][
+            sat_class
+        ] = sorted_exhaustive_allocs
         test_election.irr_results_sat[method_of_equal_shares][sat_class] = [
             initial_alloc
         ]
@@ -255,7 +342,12 @@ def dummy_elections():
     res.append(test_election)
 
     # All affordable
-    p = [Project("p0", 1), Project("p1", 3), Project("p2", 2), Project("p3", 1)]
+    p = [
+        get_project("p0", 1),
+        get_project("p1", 3),
+        get_project("p2", 2),
+        get_project("p3", 1),
+    ]
     inst = Instance(p, budget_limit=7)
     prof = ApprovalProfile([ApprovalBallot(p)], instance=inst)
     test_election = DummyElection("AllAfford", p, inst, prof)
@@ -268,33 +360,7 @@ def dummy_elections():
     res.append(test_election)
 
     # Running example from Lackner & Skowron 2023
-    p = [
-        Project("a", 1),
-        Project("b", 1),
-        Project("c", 1),
-        Project("d", 1),
-        Project("e", 1),
-        Project("f", 1),
-        Project("g", 1),
-    ]
-    inst = Instance(p, budget_limit=4)
-    prof = ApprovalProfile(
-        [
-            ApprovalBallot({p[0], p[1]}),
-            ApprovalBallot({p[0], p[1]}),
-            ApprovalBallot({p[0], p[1]}),
-            ApprovalBallot({p[0], p[2]}),
-            ApprovalBallot({p[0], p[2]}),
-            ApprovalBallot({p[0], p[2]}),
-            ApprovalBallot({p[0], p[3]}),
-            ApprovalBallot({p[0], p[3]}),
-            ApprovalBallot({p[1], p[2], p[5]}),
-            ApprovalBallot({p[4]}),
-            ApprovalBallot({p[5]}),
-            ApprovalBallot({p[6]}),
-        ],
-        instance=inst,
-    )
+    p, inst, prof = lackner_skowron_example()
     test_election = DummyElection("RunningEx LackSkow23", p, inst, prof)
     test_election.irr_results_non_sat[sequential_phragmen] = sorted([p[:4]])
     for sat_class in [Cost_Sat, Cardinality_Sat, Cost_Sqrt_Sat, Cost_Log_Sat]:
@@ -306,110 +372,85 @@ def dummy_elections():
     return res
 
 
-ALL_TEST_ELECTIONS = dummy_elections()
+@lru_cache(maxsize=1)
+def all_test_elections():
+    return tuple(dummy_elections())
 
 
-def run_sat_rule(rule, verbose=False):
-    for test_election in ALL_TEST_ELECTIONS:
-        for sat_class in test_election.irr_results_sat[rule]:
-            if test_election.irr_results_sat[rule][sat_class] is not None:
-                for profile in [
-                    test_election.profile,
-                    test_election.profile.as_multiprofile(),
-                ]:
-                    for sat_profile in [None, profile.as_sat_profile(sat_class)]:
-                        if verbose:
-                            print(
-                                f"\n=================== {rule.__name__} - {sat_class.__name__} ==================="
-                            )
-                            print(
-                                f"Test `{test_election.name}`\nInst: {test_election.instance}\nProfile: {profile}"
-                            )
-                            print(f"Sat profile: {sat_profile}")
-                            print(f"Initial alloc: {test_election.initial_alloc}")
-                            print("------------------")
-
-                        resolute_out = rule(
-                            test_election.instance,
-                            profile,
-                            sat_class=sat_class,
-                            sat_profile=sat_profile,
-                            resoluteness=True,
-                            initial_budget_allocation=test_election.initial_alloc,
-                        )
-                        if verbose:
-                            print(
-                                f"Res outcome:  {resolute_out} -- In irres: "
-                                f"{sorted(resolute_out) in test_election.irr_results_sat[rule][sat_class]} "
-                                f"({type(resolute_out)})"
-                            )
-                        irresolute_out = (
-                            rule(
-                                test_election.instance,
-                                profile,
-                                sat_class=sat_class,
-                                sat_profile=sat_profile,
-                                resoluteness=False,
-                                initial_budget_allocation=test_election.initial_alloc,
-                            )
-                        )
-                        if verbose:
-                            print(f"Irres outcome:  {irresolute_out} "
-                                  f"({tuple(type(out) for out in irresolute_out)})")
-                            print(
-                                f"Irres expected: {test_election.irr_results_sat[rule][sat_class]}"
-                            )
-                        resolute_out_sat_profile = rule(
-                            test_election.instance,
-                            test_election.profile,
-                            resoluteness=True,
-                            sat_profile=SatisfactionProfile(
-                                profile=test_election.profile, sat_class=sat_class
-                            ),
-                            initial_budget_allocation=test_election.initial_alloc,
-                        )
-                        if verbose:
-                            print(
-                                f"Res outcome with sat_profile: {resolute_out_sat_profile} -- Same: "
-                                f"{resolute_out == resolute_out_sat_profile} "
-                                f"({type(resolute_out_sat_profile)})"
-                            )
-
-                        assert (
-                            total_cost(resolute_out)
-                            <= test_election.instance.budget_limit
-                        )
-                        assert (
-                            total_cost(resolute_out_sat_profile)
-                            <= test_election.instance.budget_limit
-                        )
-                        for res in irresolute_out:
-                            assert (
-                                total_cost(res) <= test_election.instance.budget_limit
-                            )
-                        assert (
-                            sorted(resolute_out)
-                            in test_election.irr_results_sat[rule][sat_class]
-                        )
-                        assert sorted(resolute_out) == sorted(resolute_out_sat_profile)
-                        assert (
-                            sorted(sorted(x) for x in irresolute_out)
-                            == sorted(test_election.irr_results_sat[rule][sat_class])
-                        )
-
-                        assert isinstance(resolute_out, BudgetAllocation)
-                        assert isinstance(resolute_out_sat_profile, BudgetAllocation)
-                        assert isinstance(irresolute_out, list)
-                        for out in irresolute_out:
-                            assert isinstance(out, BudgetAllocation)
+def run_sat_rule(rule):
+    for test_election in all_test_elections():
+        instance = test_election.instance
+        budget_limit = instance.budget_limit
+        initial_alloc = test_election.initial_alloc
+        for sat_class, irr_results in test_election.irr_results_sat[rule].items():
+            if irr_results is None:
+                continue
+            expected_sorted, expected = test_election.get_sorted_irr_results_sat(
+                rule, sat_class
+            )
+
+            # This outcome does not depend on the profile loop below
+            resolute_out_sat_profile = rule(
+                instance,
+                test_election.profile,
+                resoluteness=True,
+                sat_profile=test_election.get_sat_profile_from_orig(sat_class),
+                initial_budget_allocation=initial_alloc,
+            )
+            assert total_cost(resolute_out_sat_profile) <= budget_limit
+            assert isinstance(resolute_out_sat_profile, BudgetAllocation)
+            resolute_out_sat_profile_sorted = sorted(resolute_out_sat_profile)
+
+            for use_multiprofile, use_sat_profile in product([False, True], repeat=2):
+                if use_multiprofile:
+                    profile = test_election.get_multiprofile()
+                else:
+                    profile = test_election.profile
+                if use_sat_profile:
+                    sat_profile = test_election.get_sat_profile(
+                        sat_class, multiprofile=use_multiprofile
+                    )
+                else:
+                    sat_profile = None
+
+                resolute_out = rule(
+                    instance,
+                    profile,
+                    sat_class=sat_class,
+                    sat_profile=sat_profile,
+                    resoluteness=True,
+                    initial_budget_allocation=initial_alloc,
+                )
+                irresolute_out = rule(
+                    instance,
+                    profile,
+                    sat_class=sat_class,
+                    sat_profile=sat_profile,
+                    resoluteness=False,
+                    initial_budget_allocation=initial_alloc,
+                )
+
+                assert total_cost(resolute_out) <= budget_limit
+                for res in irresolute_out:
+                    assert total_cost(res) <= budget_limit
+                assert tuple(sorted(resolute_out)) in expected
+                assert sorted(resolute_out) == resolute_out_sat_profile_sorted
+                assert (
+                    sorted(tuple(sorted(x)) for x in irresolute_out) == expected_sorted
+                )
+
+                assert isinstance(resolute_out, BudgetAllocation)
+                assert isinstance(irresolute_out, list)
+                for out in irresolute_out:
+                    assert isinstance(out, BudgetAllocation)
 
 
 def run_non_sat_rule(rule):
-    for test_election in ALL_TEST_ELECTIONS:
+    for test_election in all_test_elections():
         if test_election.irr_results_non_sat[rule] is not None:
             for profile in [
                 test_election.profile,
-                test_election.profile.as_multiprofile(),
+                test_election.get_multiprofile(),
             ]:
                 # print("\n===================== {} =====================".format(rule.__name__))
                 # print("Test `{}`\nInst: {}\n Profile: {}".format(test_election.name, test_election.instance,
@@ -439,12 +480,12 @@ def run_non_sat_rule(rule):
 
 class TestRule(TestCase):
     def test_greedy_welfare(self):
-        run_sat_rule(greedy_utilitarian_welfare, verbose=False)
+        run_sat_rule(greedy_utilitarian_welfare)
         with self.assertRaises(ValueError):
             greedy_utilitarian_welfare(Instance(), ApprovalProfile())
 
     def test_greedy_multiprofile(self):
-        for test_election in ALL_TEST_ELECTIONS:
+        for test_election in all_test_elections():
             outcome1 = greedy_utilitarian_welfare(
                 test_election.instance,
                 test_election.profile,
@@ -452,7 +493,7 @@ class TestRule(TestCase):
                 initial_budget_allocation=test_election.initial_alloc,
                 sat_class=Cost_Sat,
             )
-            multiprofile = test_election.profile.as_multiprofile()
+            multiprofile = test_election.get_multiprofile()
             outcome2 = greedy_utilitarian_welfare(
                 test_election.instance,
                 multiprofile,
@@ -463,7 +504,7 @@ class TestRule(TestCase):
             assert outcome1 == outcome2
 
     def test_greedy_multisat(self):
-        for test_election in ALL_TEST_ELECTIONS:
+        for test_election in all_test_elections():
             for add_sat in [True, False]:
                 sat_profile = SatisfactionProfile(
                     profile=test_election.profile, sat_class=Cost_Sat
@@ -490,7 +531,7 @@ class TestRule(TestCase):
                 assert outcome1 == outcome2
 
     def test_max_welfare(self):
-        run_sat_rule(max_additive_utilitarian_welfare, verbose=False)
+        run_sat_rule(max_additive_utilitarian_welfare)
         with self.assertRaises(ValueError):
             max_additive_utilitarian_welfare(Instance(), ApprovalProfile())
 
@@ -498,38 +539,13 @@ class TestRule(TestCase):
         run_non_sat_rule(sequential_phragmen)
 
     def test_mes_approval(self):
-        run_sat_rule(method_of_equal_shares, verbose=False)
-        run_sat_rule(mes_iterated, verbose=False)
+        run_sat_rule(method_of_equal_shares)
+        run_sat_rule(mes_iterated)
         with self.assertRaises(ValueError):
             method_of_equal_shares(Instance(), ApprovalProfile())
 
     def test_iterated_exhaustion(self):
-        projects = [
-            Project("a", 1),
-            Project("b", 1),
-            Project("c", 1),
-            Project("d", 1),
-            Project("e", 1),
-            Project("f", 1),
-            Project("g", 1),
-        ]
-        instance = Instance(projects, budget_limit=4)
-        profile = ApprovalProfile(
-            [
-                ApprovalBallot({projects[0], projects[1]}),
-                ApprovalBallot({projects[0], projects[1]}),
-                ApprovalBallot({projects[0], projects[1]}),
-                ApprovalBallot({projects[0], projects[2]}),
-                ApprovalBallot({projects[0], projects[2]}),
-                ApprovalBallot({projects[0], projects[2]}),
-                ApprovalBallot({projects[0], projects[3]}),
-                ApprovalBallot({projects[0], projects[3]}),
-                ApprovalBallot({projects[1], projects[2], projects[5]}),
-                ApprovalBallot({projects[4]}),
-                ApprovalBallot({projects[5]}),
-                ApprovalBallot({projects[6]}),
-            ]
-        )
+        projects, instance, profile = lackner_skowron_example()
         budget_allocation_mes = method_of_equal_shares(instance, profile, Cost_Sat)
         assert budget_allocation_mes == [projects[0]]
 
@@ -576,24 +592,20 @@ class TestRule(TestCase):
 
     def test_completion(self):
         projects = [
-            Project("a", 1),
-            Project("b", 2),
-            Project("c", 2),
-            Project("d", 1),
-            Project("e", 1),
-            Project("f", 1),
+            get_project("a", 1),
+            get_project("b", 2),
+            get_project("c", 2),
+            get_project("d", 1),
+            get_project("e", 1),
+            get_project("f", 1),
         ]
         instance = Instance(projects, budget_limit=5)
         profile = ApprovalProfile(
-            [
-                ApprovalBallot({projects[0], projects[1]}),
-                ApprovalBallot({projects[0], projects[1]}),
-                ApprovalBallot({projects[0]}),
-                ApprovalBallot({projects[0], projects[2]}),
-                ApprovalBallot({projects[0], projects[2]}),
-                ApprovalBallot({projects[0], projects[2]}),
-                ApprovalBallot({projects[0], projects[3]}),
-                ApprovalBallot({projects[0], projects[3]}),
+            [ApprovalBallot({projects[0], projects[1]})] * 2
+            + [ApprovalBallot({projects[0]})]
+            + [ApprovalBallot({projects[0], projects[2]})] * 3
+            + [ApprovalBallot({projects[0], projects[3]})] * 2
+            + [
                 ApprovalBallot({projects[5]}),
                 ApprovalBallot({projects[4]}),
             ]
@@ -652,21 +664,14 @@ class TestRule(TestCase):
             ],
         )
 
-        p1 = Project("p1", 2)
-        p2 = Project("p2", 2)
-        p3 = Project("p3", 3)
+        p1 = get_project("p1", 2)
+        p2 = get_project("p2", 2)
+        p3 = get_project("p3", 3)
         instance = Instance([p1, p2, p3], budget_limit=4)
         profile = ApprovalProfile(
-            [
-                ApprovalBallot([p1]),
-                ApprovalBallot([p1]),
-                ApprovalBallot([p1]),
-                ApprovalBallot([p1]),
-                ApprovalBallot([p1]),
-                ApprovalBallot([p2]),
-                ApprovalBallot([p3]),
-                ApprovalBallot([p3]),
-            ]
+            [ApprovalBallot([p1])] * 5
+            + [ApprovalBallot([p2])]
+            + [ApprovalBallot([p3])] * 2
         )
 
         def mes_phragmen(instance, profile, resoluteness=True):
@@ -180,6 +180,12 @@ class TestSatisfaction(TestCase):
         assert sat_profile[0].sat(projects) == 74
         assert sat_profile[1].sat(projects[2:]) == 68
         assert sat_profile[2].sat(projects) == 0
+        assert sat_profile[0].project_sats == {}
+        assert sat_profile[0].sat_project(projects[2]) == 74
+        assert sat_profile[0].project_sats == {projects[2]: 74}
+        assert sat_profile[0].sat_project(projects[2]) == 74
+        assert sat_profile[0].sat_project(projects[0]) == 0
+        assert sat_profile[0].project_sats == {projects[2]: 74, projects[0]: 0}
 
         with self.assertRaises(ValueError):
             CC_Sat(Instance(), OrdinalProfile(), OrdinalBallot())